@@ -1,19 +1,305 @@
 import streamlit as st
 import time
+import asyncio
+import atexit
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import requests
+from requests.adapters import HTTPAdapter
 
 from selenium import webdriver
 from selenium.webdriver.edge.options import Options  # Using Edge as our browser
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+@st.cache_resource
+def get_http_session():
+    """
+    One shared HTTP session so repeated searches and page clicks reuse
+    keep-alive connections instead of paying a new TCP/TLS handshake each time.
+    Streamlit re-executes this script on every rerun, so st.cache_resource is
+    what keeps the same session (and its connection pool) alive between them.
+    """
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0",
+        # Result pages are large HTML; ask for compression (br needs the brotli package to decode).
+        "Accept-Encoding": "gzip, deflate, br",
+        "Accept": "text/html,*/*;q=0.8",
+    })
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    atexit.register(session.close)
+    return session
+
+# Search URL templates, filled with an already quote_plus-encoded keyword.
+IK_SEARCH_URL = "https://indiankanoon.org/search/?formInput={}".format
+IK_SEARCH_PAGE_URL = "https://indiankanoon.org/search/?formInput={}&pagenum={}".format
+
+# Justia's search page, which renders Google Custom Search results in the browser.
+JUSTIA_SEARCH_URL = "https://www.justia.com/search?q={}&cx=012624009653992735869%3Acyxxdwappru&start={}".format
+
+# AustLII can return very long result lists; stop parsing once we have this many.
+AUSTLII_MAX_RESULTS = 20
+
+#####################################
+# Shared Headless Browser Pool
+#####################################
+
+# Injected into every page the pooled browsers load: hides CanLII's cookie
+# consent overlay so it never sits on top of the search form.
+HIDE_COOKIE_BLOCKER_JS = (
+    "document.addEventListener('DOMContentLoaded', function () {"
+    " var style = document.createElement('style');"
+    " style.textContent = '#cookieConsentBlocker { display: none !important; }';"
+    " document.head.appendChild(style); });"
+)
+
+class WebDriverPool:
+    """
+    Keeps a few headless Edge drivers alive between searches so the
+    Selenium-based sources don't pay the browser startup cost on every query.
+    Drivers are started on demand, up to `size`, and handed back with put().
+    """
+
+    def __init__(self, size=2):
+        self.size = size
+        self.drivers = []
+        self._starting = 0
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+
+    def _new_driver(self):
+        edge_options = Options()
+        edge_options.add_argument("--headless")
+        edge_options.add_argument("--disable-gpu")
+        # Additional options can be added if needed (e.g., --no-sandbox, --disable-dev-shm-usage)
+        driver = webdriver.Edge(options=edge_options)
+        # Registered once per browser, so searches don't spend a script round trip on it.
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": HIDE_COOKIE_BLOCKER_JS})
+        except WebDriverException:
+            driver.quit()
+            raise
+        return driver
+
+    def get(self):
+        while True:
+            with self._lock:
+                spawn = self._idle.empty() and len(self.drivers) + self._starting < self.size
+                if spawn:
+                    self._starting += 1
+            if spawn:
+                break
+            try:
+                # Short timeout so a waiter notices a slot freed up by discard().
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                continue
+        return self._start_reserved()
+
+    def try_get(self):
+        """
+        An idle driver if one is ready right now, otherwise None. Never waits
+        and never starts a browser, so speculative work can't hold up a search.
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _start_reserved(self):
+        # Start a browser for a slot already counted in self._starting.
+        try:
+            driver = self._new_driver()
+        except Exception:
+            with self._lock:
+                self._starting -= 1
+            raise
+        with self._lock:
+            self._starting -= 1
+            self.drivers.append(driver)
+        return driver
+
+    def prewarm(self, count):
+        """
+        Start up to `count` idle drivers ahead of the first search.
+        """
+        for _ in range(count):
+            with self._lock:
+                if len(self.drivers) + self._starting >= self.size:
+                    return
+                self._starting += 1
+            try:
+                driver = self._start_reserved()
+            except WebDriverException:
+                return  # the search itself will retry and report the error
+            self._idle.put(driver)
+
+    def put(self, driver):
+        try:
+            driver.delete_all_cookies()
+        except WebDriverException:
+            # The browser died; drop it so the next get() starts a fresh one.
+            self.discard(driver)
+            return
+        self._idle.put(driver)
+
+    def discard(self, driver):
+        with self._lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self):
+        with self._lock:
+            drivers, self.drivers = self.drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+@st.cache_resource
+def get_driver_pool():
+    """
+    One pool per server process; st.cache_resource keeps it alive across reruns.
+    """
+    pool = WebDriverPool(size=2)
+    atexit.register(pool.close)
+    return pool
 
 #####################################
 # Search Functions for Various Sources
 #####################################
 
+def element_text(element):
+    """
+    Text of an lxml element, stripped and joined the same way as
+    BeautifulSoup's get_text(strip=True).
+    """
+    return "".join(text.strip() for text in element.itertext())
+
+def following_text(element):
+    """
+    First non-blank text node after an element among its siblings.
+    """
+    return element.xpath("string(following-sibling::text()[normalize-space()][1])").strip()
+
+class IKResultHandler:
+    """
+    lxml parser target that turns an Indian Kanoon search page straight into
+    result dicts, without building a tree: the first link inside each
+    div.result_title gives the title and link, and the text of the next
+    sibling div gives the details.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.results = []
+        self._depth = 0
+        self._chunks = []  # pieces of the text node currently being read
+        # The open div.result_title, and the result its first link started.
+        self._title_depth = None
+        self._title_result = None
+        # The title link being read.
+        self._anchor_depth = None
+        self._anchor_result = None
+        self._anchor_parts = []
+        # The details div being read.
+        self._details_depth = None
+        self._details_result = None
+        self._details_parts = []
+        # A finished result still looking for its details div.
+        self._awaiting_depth = None
+        self._awaiting_result = None
+
+    def _flush(self):
+        # lxml can split one text node over several data() calls, so only
+        # strip whole nodes, the same way get_text(strip=True) does.
+        text = "".join(self._chunks).strip()
+        self._chunks = []
+        if text:
+            if self._anchor_depth is not None:
+                self._anchor_parts.append(text)
+            if self._details_depth is not None:
+                self._details_parts.append(text)
+
+    def start(self, tag, attrib):
+        self._flush()
+        self._depth += 1
+        if tag == "div":
+            if self._awaiting_depth is not None and self._depth == self._awaiting_depth:
+                self._details_depth = self._depth
+                self._details_result = self._awaiting_result
+                self._details_parts = []
+                self._awaiting_depth = self._awaiting_result = None
+            if self._title_depth is None and "result_title" in attrib.get("class", "").split():
+                self._title_depth = self._depth
+        elif tag == "a" and self._title_depth is not None and self._title_result is None and "href" in attrib:
+            link = attrib["href"]
+            if not link.startswith("http"):
+                link = "https://indiankanoon.org" + link
+            self._title_result = {"title": "", "link": link, "details": ""}
+            self._anchor_depth = self._depth
+            self._anchor_result = self._title_result
+            self._anchor_parts = []
+
+    def end(self, tag):
+        self._flush()
+        if self._anchor_depth is not None and self._depth == self._anchor_depth:
+            self._anchor_result["title"] = "".join(self._anchor_parts)
+            self._anchor_depth = self._anchor_result = None
+        if self._details_depth is not None and self._depth == self._details_depth:
+            self._details_result["details"] = "".join(self._details_parts)
+            self._details_depth = self._details_result = None
+        if self._title_depth is not None and self._depth == self._title_depth:
+            if self._title_result is not None:
+                self.results.append(self._title_result)
+                self._awaiting_depth = self._title_depth
+                self._awaiting_result = self._title_result
+            self._title_depth = self._title_result = None
+        elif self._awaiting_depth is not None and self._depth < self._awaiting_depth:
+            self._awaiting_depth = self._awaiting_result = None  # the parent closed without another div
+        self._depth -= 1
+
+    def data(self, data):
+        self._chunks.append(data)
+
+    def close(self):
+        results = self.results
+        self.reset()
+        return results
+
+@st.cache_resource
+def get_ik_parsers():
+    """
+    Indian Kanoon parsers, one per thread. lxml parsers can't be shared
+    between threads, and pages are fetched from the script thread, the
+    Search workers and the prefetch executor. Like get_http_session, this
+    lives in st.cache_resource so a long-lived thread keeps reusing its
+    parser across reruns; close() resets the handler after every page.
+    """
+    return threading.local()
+
+def get_ik_parser():
+    parsers = get_ik_parsers()
+    if not hasattr(parsers, "parser"):
+        parsers.parser = etree.HTMLParser(target=IKResultHandler())
+    return parsers.parser
+
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
 def fetch_indian_kanoon_results(keyword, page):
     """
     For Indian Kanoon:
@@ -21,70 +307,61 @@ def fetch_indian_kanoon_results(keyword, page):
       - For subsequent pages, the URL uses &pagenum=page-1.
     """
     encoded_keyword = quote_plus(keyword)
-    if page == 1:
-        search_url = f"https://indiankanoon.org/search/?formInput={encoded_keyword}"
-    else:
-        search_url = f"https://indiankanoon.org/search/?formInput={encoded_keyword}&pagenum={page-1}"
-    headers = {"User-Agent": "Mozilla/5.0"}
+    search_url = IK_SEARCH_PAGE_URL(encoded_keyword, page - 1) if page > 1 else IK_SEARCH_URL(encoded_keyword)
     
-    response = requests.get(search_url, headers=headers)
-    if response.status_code != 200:
-        return []
+    response = get_http_session().get(search_url, timeout=20)
+    response.raise_for_status()
     
-    soup = BeautifulSoup(response.content, "html.parser")
-    results = []
-    for result in soup.find_all("div", class_="result_title"):
-        anchor = result.find("a", href=True)
-        if anchor:
-            title = anchor.get_text(strip=True)
-            link = anchor["href"]
-            if not link.startswith("http"):
-                link = "https://indiankanoon.org" + link
-            detail_elem = result.find_next_sibling("div")
-            details = detail_elem.get_text(strip=True) if detail_elem else ""
-            results.append({"title": title, "link": link, "details": details})
-    return results
+    # The parser's target returns the result dicts directly.
+    return etree.HTML(response.content, get_ik_parser())
 
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
 def fetch_austlii_search_results(keyword):
     encoded_keyword = quote_plus(keyword)
     search_url = f"https://www.austlii.edu.au/cgi-bin/sinosrch.cgi?method=auto&query={encoded_keyword}"
-    headers = {"User-Agent": "Mozilla/5.0"}
     
-    try:
-        response = requests.get(search_url, headers=headers, timeout=20)
+    response = get_http_session().get(search_url, timeout=20, stream=True)
+    if not response.ok:
+        response.close()
         response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        st.error("Error fetching AustLII results: " + str(e))
-        return [{
-            "title": "AustLII",
-            "link": "",
-            "details": "AustLII results are currently unavailable due to a connection error."
-        }]
     
-    soup = BeautifulSoup(response.content, "html.parser")
+    # Stream the page through lxml and stop as soon as enough results are
+    # collected, pruning parsed elements as we go so memory stays flat.
     results = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"]
-        if "/cgi-bin/viewdoc/" not in href:
-            continue
-        link = href if href.startswith("http") else "https://www.austlii.edu.au" + href
-        title = a.get_text(strip=True)
-        if not title:
-            next_text = a.next_sibling
-            while next_text:
-                if hasattr(next_text, "strip") and next_text.strip():
-                    title = next_text.strip()
+    pending = []  # (anchor element, result) pairs still waiting for their <p class="meta">
+    response.raw.decode_content = True
+    try:
+        for _, elem in etree.iterparse(response.raw, events=("end",), tag=("a", "p"), html=True):
+            if elem.tag == "a":
+                href = elem.get("href", "")
+                if "/cgi-bin/viewdoc/" in href:
+                    link = href if href.startswith("http") else "https://www.austlii.edu.au" + href
+                    result = {"title": element_text(elem), "link": link, "details": ""}
+                    results.append(result)
+                    pending.append((elem, result))
+                    continue
+            elif "meta" in elem.get("class", "").split():
+                details = element_text(elem)
+                for anchor, result in pending:
+                    result["details"] = details
+                    if not result["title"]:
+                        # The text after the anchor is parsed by now, so the fallback title can be read.
+                        result["title"] = following_text(anchor)
+                pending = []
+                if len(results) >= AUSTLII_MAX_RESULTS:
                     break
-                next_text = next_text.next_sibling
-        details = ""
-        p_meta = a.find_next("p", class_="meta")
-        if p_meta:
-            details = p_meta.get_text(strip=True)
-        results.append({
-            "title": title,
-            "link": link,
-            "details": details
-        })
+            if not pending:
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    except etree.XMLSyntaxError:
+        pass  # empty or unparseable page; fall through with whatever was collected
+    finally:
+        response.close()
+    for anchor, result in pending:
+        if not result["title"]:
+            result["title"] = following_text(anchor)
+    del results[AUSTLII_MAX_RESULTS:]
     if not results:
         results.append({
             "title": "AustLII",
@@ -93,89 +370,223 @@ def fetch_austlii_search_results(keyword):
         })
     return results
 
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
 def fetch_canlii_search_results(keyword):
     base_url = "https://www.canlii.org/en/"
     
-    edge_options = Options()
-    edge_options.add_argument("--headless")
-    edge_options.add_argument("--disable-gpu")
-    # Additional options can be added if needed (e.g., --no-sandbox, --disable-dev-shm-usage)
+    pool = get_driver_pool()
     
     driver = None
     html = ""
     try:
-        driver = webdriver.Edge(options=edge_options)
+        driver = pool.get()
+        # The cookie consent blocker is hidden by the pool's HIDE_COOKIE_BLOCKER_JS.
         driver.get(base_url)
-        # Hide potential cookie consent blocker
-        driver.execute_script(
-            "if(document.getElementById('cookieConsentBlocker')) { "
-            "document.getElementById('cookieConsentBlocker').style.display = 'none'; }"
-        )
-        # Wait explicitly for the search bar to be present
-        search_bar = WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#textInput"))
-        )
-        driver.execute_script("arguments[0].value = arguments[1];", search_bar, keyword)
-        search_button = WebDriverWait(driver, 20).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Start a search']"))
+        # Wait for the search bar and button together, polling faster than the 0.5 s default
+        search_bar, search_button = WebDriverWait(driver, 20, poll_frequency=0.1).until(
+            EC.all_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#textInput")),
+                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[aria-label='Start a search']")),
+            )
         )
+        search_bar.send_keys(keyword)
         search_button.click()
-        WebDriverWait(driver, 40).until(
+        WebDriverWait(driver, 40, poll_frequency=0.1).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "a[data-result-uuid]"))
         )
         html = driver.page_source
-    except Exception as err:
-        st.error("Error fetching CanLII results: " + str(err))
     finally:
         if driver is not None:
-            driver.quit()
+            pool.put(driver)
             
-    soup = BeautifulSoup(html, "html.parser")
+    if not html:
+        return []
+    tree = lxml.html.fromstring(html)
     results = []
-    for a in soup.select("a[data-result-uuid]"):
-        title = a.get_text(strip=True)
-        link = a["href"]
+    for a in tree.xpath("//a[@data-result-uuid]"):
+        title = element_text(a)
+        link = a.get("href", "")
         if not link.startswith("http"):
             link = "https://www.canlii.org" + link
         results.append({"title": title, "link": link})
     return results
 
+def load_justia_page(driver, keyword, page):
+    """
+    Open a Justia results page in `driver` and return its HTML once the
+    Google Custom Search results have rendered.
+    """
+    driver.get(JUSTIA_SEARCH_URL(quote_plus(keyword), (page - 1) * 10))
+    WebDriverWait(driver, 20, poll_frequency=0.1).until(
+        EC.presence_of_element_located((By.CLASS_NAME, "gsc-webResult"))
+    )
+    return driver.page_source
+
+@st.cache_data(ttl=600, max_entries=128, show_spinner=False)
 def fetch_justia_search_results(keyword, page):
-    edge_options = Options()
-    edge_options.add_argument("--headless")
-    edge_options.add_argument("--disable-gpu")
+    pool = get_driver_pool()
     
     driver = None
     html = ""
     try:
-        search_url = (
-            f"https://www.justia.com/search?q={quote_plus(keyword)}"
-            f"&cx=012624009653992735869%3Acyxxdwappru&start={(page - 1) * 10}"
-        )
-        driver = webdriver.Edge(options=edge_options)
-        driver.get(search_url)
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "gsc-webResult"))
-        )
-        html = driver.page_source
-    except Exception as err:
-        st.error("Error fetching Justia results: " + str(err))
+        driver = pool.get()
+        html = load_justia_page(driver, keyword, page)
     finally:
         if driver is not None:
-            driver.quit()
-    
-    soup = BeautifulSoup(html, "html.parser")
+            pool.put(driver)
+    return parse_justia_results(html)
+
+def prefetch_justia_search_results(keyword, page):
+    """
+    Speculative Justia fetch for prefetch_page. The browsers are shared by
+    every session, so this only uses one that is idle right now and returns
+    None otherwise; the Next click then fetches the page itself.
+    """
+    pool = get_driver_pool()
+    driver = pool.try_get()
+    if driver is None:
+        return None
+    try:
+        html = load_justia_page(driver, keyword, page)
+    finally:
+        pool.put(driver)
+    return parse_justia_results(html)
+
+def parse_justia_results(html):
+    if not html:
+        return []
+    tree = lxml.html.fromstring(html)
     results = []
-    for result in soup.select("div.gsc-webResult a.gs-title"):
-        title = result.get_text(strip=True)
-        link = result.get("href", "")
-        results.append({"title": title, "link": link})
+    for a in tree.xpath(
+        '//div[contains(concat(" ", normalize-space(@class), " "), " gsc-webResult ")]'
+        '//a[contains(concat(" ", normalize-space(@class), " "), " gs-title ")]'
+    ):
+        results.append({"title": element_text(a), "link": a.get("href", "")})
     return results
 
+# Errors the fetchers raise instead of returning a result. st.cache_data
+# doesn't cache exceptions, so a failed fetch is retried on the next call.
+FETCH_ERRORS = (requests.exceptions.RequestException, WebDriverException)
+
+# What AustLII shows when it can't be reached.
+AUSTLII_UNAVAILABLE = [{
+    "title": "AustLII",
+    "link": "",
+    "details": "AustLII results are currently unavailable due to a connection error."
+}]
+
+def load_results(source_name, fetch, args, fallback=(), prefetch_key=None):
+    """
+    Call a cached fetcher, reporting a failed fetch with st.error and
+    returning the source's fallback results instead. Failures are remembered
+    in st.session_state.fetch_errors until the next Search, so reruns show the
+    error again without re-requesting the page. With `prefetch_key`, a
+    matching background prefetch is used instead of fetching now.
+
+    The page last shown for each source is kept in
+    st.session_state.shown_results, so a rerun that stays on the same page
+    (a checkbox toggle, a click on another source) redraws it from there.
+    It never waits on a fetch whose cache entry has expired, and the
+    results can't change under the user.
+    """
+    shown = st.session_state.setdefault("shown_results", {})
+    args = tuple(args)
+    if source_name in shown and shown[source_name][0] == args:
+        return shown[source_name][1]
+    errors = st.session_state.setdefault("fetch_errors", {})
+    key = (source_name, args)
+    if key not in errors:
+        try:
+            if prefetch_key is not None:
+                results = take_prefetched_page(prefetch_key, fetch, *args)
+            else:
+                results = fetch(*args)
+        except FETCH_ERRORS as err:
+            errors[key] = str(err)
+        else:
+            shown[source_name] = (args, results)
+            return results
+    st.error(f"Error fetching {source_name} results: {errors[key]}")
+    return list(fallback)
+
+def run_fetches_concurrently(jobs):
+    """
+    Run several (fetch_function, args) jobs at the same time and return their
+    results in the same order. The fetchers are blocking (requests/Selenium), so
+    each one runs in a worker thread and asyncio.gather waits for all of them.
+    A job that fails with one of FETCH_ERRORS returns the exception instead.
+    """
+    if not jobs:
+        return []
+    ctx = get_script_run_ctx()
+
+    def call(fetch, args):
+        # Attach the Streamlit context so cached fetchers can reach the runtime.
+        add_script_run_ctx(ctx=ctx)
+        try:
+            return fetch(*args)
+        except FETCH_ERRORS as err:
+            return err
+
+    async def gather_all():
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            return await asyncio.gather(
+                *(loop.run_in_executor(executor, call, fetch, args) for fetch, args in jobs)
+            )
+
+    return asyncio.run(gather_all())
+
+@st.cache_resource
+def get_prefetch_executor():
+    """
+    Background worker for speculative next-page fetches. Kept in
+    st.cache_resource so reruns share it instead of each starting a new one.
+    """
+    return ThreadPoolExecutor(max_workers=2)
+
+def prefetch_page(state_key, fetch, keyword, page):
+    """
+    Start fetching `page` in the background and remember the future under
+    `state_key`, so a Next click can pick it up instead of waiting on the network.
+    """
+    prefetch = st.session_state.get(state_key)
+    if prefetch is None or prefetch[:2] != (keyword, page):
+        ctx = get_script_run_ctx()
+
+        def call():
+            # Attach the Streamlit context so cached fetchers can reach the runtime.
+            add_script_run_ctx(ctx=ctx)
+            return fetch(keyword, page)
+
+        st.session_state[state_key] = (keyword, page, get_prefetch_executor().submit(call))
+
+def take_prefetched_page(state_key, fetch, keyword, page):
+    """
+    Results for `page`, taken from the background prefetch when it matches,
+    otherwise fetched now. A prefetch that returned None was skipped.
+    """
+    prefetch = st.session_state.pop(state_key, None)
+    if prefetch is not None and prefetch[:2] == (keyword, page):
+        try:
+            results = prefetch[2].result()
+        except FETCH_ERRORS:
+            results = None  # the speculative fetch failed and wasn't cached; try again now
+        if results is not None:
+            return results
+    return fetch(keyword, page)
+
 #####################################
 # Formatting Functions
 #####################################
 
+def format_result_entry(number, res):
+    """
+    Markdown block for a single numbered result.
+    """
+    details = f"- Details: {res['details']}\n" if res.get("details") else ""
+    return f"**{number}. {res['title']}**\n- Link: {res['link']}\n{details}\n"
+
 def format_results(results, source_name):
     """
     Generic formatting for sources that restart numbering.
@@ -184,12 +595,7 @@ def format_results(results, source_name):
     if not results:
         formatted += "No results found.\n"
         return formatted
-    for i, res in enumerate(results, 1):
-        formatted += f"**{i}. {res['title']}**\n- Link: {res['link']}\n"
-        if res.get("details"):
-            formatted += f"- Details: {res['details']}\n"
-        formatted += "\n"
-    return formatted
+    return formatted + "".join(format_result_entry(i, res) for i, res in enumerate(results, 1))
 
 def format_indian_kanoon_results(results, current_page):
     """
@@ -198,18 +604,14 @@ def format_indian_kanoon_results(results, current_page):
     """
     if not results:
         return "No results found."
-    if "ik_counts" not in st.session_state:
-        st.session_state.ik_counts = {}
-    st.session_state.ik_counts[current_page] = len(results)
-    cumulative = sum(st.session_state.ik_counts.get(page, 0) for page in range(1, current_page))
-    start_num = cumulative + 1
-    formatted = f"### Indian Kanoon Results (Page {current_page})\n\n"
-    for i, res in enumerate(results, start=start_num):
-        formatted += f"**{i}. {res['title']}**\n- Link: {res['link']}\n"
-        if res.get("details"):
-            formatted += f"- Details: {res['details']}\n"
-        formatted += "\n"
-    return formatted
+    if "ik_offsets" not in st.session_state:
+        st.session_state.ik_offsets = {}
+    # ik_offsets[page] is the running total of results up to and including that page.
+    offsets = st.session_state.ik_offsets
+    offsets[current_page] = offsets.get(current_page - 1, 0) + len(results)
+    start_num = offsets.get(current_page - 1, 0) + 1
+    header = f"### Indian Kanoon Results (Page {current_page})\n\n"
+    return header + "".join(format_result_entry(i, res) for i, res in enumerate(results, start=start_num))
 
 def format_justia_results(results, current_page):
     """
@@ -217,15 +619,14 @@ def format_justia_results(results, current_page):
     """
     if not results:
         return "No results found."
-    if "justia_counts" not in st.session_state:
-        st.session_state.justia_counts = {}
-    st.session_state.justia_counts[current_page] = len(results)
-    cumulative = sum(st.session_state.justia_counts.get(page, 0) for page in range(1, current_page))
-    start_num = cumulative + 1
-    formatted = f"### Justia Results (Page {current_page})\n\n"
-    for i, res in enumerate(results, start=start_num):
-        formatted += f"**{i}. {res['title']}**\n- Link: {res['link']}\n\n"
-    return formatted
+    if "justia_offsets" not in st.session_state:
+        st.session_state.justia_offsets = {}
+    # justia_offsets[page] is the running total of results up to and including that page.
+    offsets = st.session_state.justia_offsets
+    offsets[current_page] = offsets.get(current_page - 1, 0) + len(results)
+    start_num = offsets.get(current_page - 1, 0) + 1
+    header = f"### Justia Results (Page {current_page})\n\n"
+    return header + "".join(format_result_entry(i, res) for i, res in enumerate(results, start=start_num))
 
 #####################################
 # Main Streamlit Dashboard App
@@ -235,6 +636,11 @@ def main():
     st.title("Legal Search Dashboard")
     st.write("This dashboard searches multiple legal databases for your query.")
 
+    # Start browsers for CanLII and Justia in the background while the user types the query.
+    if not st.session_state.setdefault("driver_warmed", False):
+        st.session_state.driver_warmed = True
+        threading.Thread(target=get_driver_pool().prewarm, args=(2,), daemon=True).start()
+
     # --- Checkbox Options to Choose Which Sources to Search ---
     search_ik = st.checkbox("Indian Kanoon", value=True)
     search_al = st.checkbox("AustLII", value=True)
@@ -250,6 +656,9 @@ def main():
         st.session_state.justia_page = 1
     if "results_fetched" not in st.session_state:
         st.session_state.results_fetched = False
+    if "searched_sources" not in st.session_state:
+        st.session_state.searched_sources = set()
+    searched = st.session_state.searched_sources
 
     # --- Search Input ---
     keyword_input = st.text_input("Enter keyword to search:", value=st.session_state.keyword)
@@ -258,73 +667,109 @@ def main():
     if st.button("Search", key="search_button"):
         st.session_state.keyword = keyword_input
 
+        st.session_state.ik_page = 1  # reset Indian Kanoon pagination
+        st.session_state.justia_page = 1  # reset Justia pagination
+
+        # Fire all selected sources at once so the wait is the slowest source, not the sum.
+        # Successful results become the pages the display below shows; failures
+        # are recorded so they are reported once.
+        jobs = []
         if search_ik:
-            st.session_state.ik_page = 1  # reset Indian Kanoon pagination
-            st.session_state.ik_results = fetch_indian_kanoon_results(st.session_state.keyword, st.session_state.ik_page)
-        else:
-            st.session_state.ik_results = []
-        
+            jobs.append(("Indian Kanoon", fetch_indian_kanoon_results, (st.session_state.keyword, st.session_state.ik_page)))
         if search_al:
-            st.session_state.austlii_results = fetch_austlii_search_results(st.session_state.keyword)
-        else:
-            st.session_state.austlii_results = []
-        
+            jobs.append(("AustLII", fetch_austlii_search_results, (st.session_state.keyword,)))
         if search_cl:
-            st.session_state.canlii_results = fetch_canlii_search_results(st.session_state.keyword)
-        else:
-            st.session_state.canlii_results = []
-        
+            jobs.append(("CanLII", fetch_canlii_search_results, (st.session_state.keyword,)))
         if search_justia:
-            st.session_state.justia_page = 1  # reset Justia pagination
-            st.session_state.justia_results = fetch_justia_search_results(st.session_state.keyword, st.session_state.justia_page)
-        else:
-            st.session_state.justia_results = []
+            jobs.append(("Justia", fetch_justia_search_results, (st.session_state.keyword, st.session_state.justia_page)))
+        outcomes = run_fetches_concurrently([(fetch, args) for _, fetch, args in jobs])
+
+        st.session_state.shown_results = {
+            source_name: (args, outcome)
+            for (source_name, _, args), outcome in zip(jobs, outcomes)
+            if not isinstance(outcome, Exception)
+        }
+        st.session_state.fetch_errors = {
+            (source_name, args): str(outcome)
+            for (source_name, _, args), outcome in zip(jobs, outcomes)
+            if isinstance(outcome, Exception)
+        }
+        # Sources ticked after this search show no results until the next Search or page click.
+        searched.clear()
+        searched.update(source_name for source_name, _, _ in jobs)
         
         st.session_state.results_fetched = True
 
-        # Reset stored counts for continuous numbering
-        st.session_state.ik_counts = {}
-        st.session_state.justia_counts = {}
+        # Reset stored offsets for continuous numbering
+        st.session_state.ik_offsets = {}
+        st.session_state.justia_offsets = {}
 
     # --- Display results if a search has been performed ---
     if st.session_state.results_fetched:
         if search_ik:
-            st.markdown(format_indian_kanoon_results(st.session_state.ik_results, st.session_state.ik_page))
+            ik_results = []
+            if "Indian Kanoon" in searched:
+                ik_results = load_results("Indian Kanoon", fetch_indian_kanoon_results, (st.session_state.keyword, st.session_state.ik_page))
+            st.markdown(format_indian_kanoon_results(ik_results, st.session_state.ik_page))
             ik_container = st.empty()
             col1, col2, col3 = st.columns([1, 2, 1])
             if col1.button("← Previous", key="prev_ik") and st.session_state.ik_page > 1:
                 st.session_state.ik_page -= 1
-                st.session_state.ik_results = fetch_indian_kanoon_results(st.session_state.keyword, st.session_state.ik_page)
-                ik_container.markdown(format_indian_kanoon_results(st.session_state.ik_results, st.session_state.ik_page))
+                searched.add("Indian Kanoon")
+                ik_results = load_results("Indian Kanoon", fetch_indian_kanoon_results, (st.session_state.keyword, st.session_state.ik_page))
+                ik_container.markdown(format_indian_kanoon_results(ik_results, st.session_state.ik_page))
             col2.write(f"Page {st.session_state.ik_page}")
             if col3.button("Next →", key="next_ik"):
                 st.session_state.ik_page += 1
-                st.session_state.ik_results = fetch_indian_kanoon_results(st.session_state.keyword, st.session_state.ik_page)
-                ik_container.markdown(format_indian_kanoon_results(st.session_state.ik_results, st.session_state.ik_page))
+                searched.add("Indian Kanoon")
+                ik_results = load_results(
+                    "Indian Kanoon", fetch_indian_kanoon_results, (st.session_state.keyword, st.session_state.ik_page),
+                    prefetch_key="ik_prefetch",
+                )
+                ik_container.markdown(format_indian_kanoon_results(ik_results, st.session_state.ik_page))
+            # Users usually read on, so fetch the next page while they read this one.
+            if ik_results:
+                prefetch_page("ik_prefetch", fetch_indian_kanoon_results, st.session_state.keyword, st.session_state.ik_page + 1)
             st.markdown("---")
         
         if search_al:
-            st.markdown(format_results(st.session_state.austlii_results, "AustLII"))
+            austlii_results = []
+            if "AustLII" in searched:
+                austlii_results = load_results("AustLII", fetch_austlii_search_results, (st.session_state.keyword,), AUSTLII_UNAVAILABLE)
+            st.markdown(format_results(austlii_results, "AustLII"))
             st.markdown("---")
         
         if search_cl:
-            st.markdown(format_results(st.session_state.canlii_results, "CanLII"))
+            canlii_results = []
+            if "CanLII" in searched:
+                canlii_results = load_results("CanLII", fetch_canlii_search_results, (st.session_state.keyword,))
+            st.markdown(format_results(canlii_results, "CanLII"))
             st.markdown("---")
         
         if search_justia:
             st.markdown("### Justia Results")
             justia_container = st.empty()
-            justia_container.markdown(format_justia_results(st.session_state.justia_results, st.session_state.justia_page))
+            justia_results = []
+            if "Justia" in searched:
+                justia_results = load_results("Justia", fetch_justia_search_results, (st.session_state.keyword, st.session_state.justia_page))
+            justia_container.markdown(format_justia_results(justia_results, st.session_state.justia_page))
             col4, col5, col6 = st.columns([1, 2, 1])
             if col4.button("← Previous", key="prev_justia") and st.session_state.justia_page > 1:
                 st.session_state.justia_page -= 1
-                st.session_state.justia_results = fetch_justia_search_results(st.session_state.keyword, st.session_state.justia_page)
-                justia_container.markdown(format_justia_results(st.session_state.justia_results, st.session_state.justia_page))
+                searched.add("Justia")
+                justia_results = load_results("Justia", fetch_justia_search_results, (st.session_state.keyword, st.session_state.justia_page))
+                justia_container.markdown(format_justia_results(justia_results, st.session_state.justia_page))
             col5.write(f"Page {st.session_state.justia_page}")
             if col6.button("Next →", key="next_justia"):
                 st.session_state.justia_page += 1
-                st.session_state.justia_results = fetch_justia_search_results(st.session_state.keyword, st.session_state.justia_page)
-                justia_container.markdown(format_justia_results(st.session_state.justia_results, st.session_state.justia_page))
+                searched.add("Justia")
+                justia_results = load_results(
+                    "Justia", fetch_justia_search_results, (st.session_state.keyword, st.session_state.justia_page),
+                    prefetch_key="justia_prefetch",
+                )
+                justia_container.markdown(format_justia_results(justia_results, st.session_state.justia_page))
+            if justia_results:
+                prefetch_page("justia_prefetch", prefetch_justia_search_results, st.session_state.keyword, st.session_state.justia_page + 1)
 
 if __name__ == '__main__':
     main()